@@ -0,0 +1,106 @@
+"""
+    Bytes-on-wire and CPU cost of CompressionMiddleware per request.
+
+    Run from the repo root:
+        python -m backend.benchmarks.compression_benchmark --rows 2000
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from backend.middleware.compression import CompressionMiddleware
+
+STATUSES = ["not_started", "in_progress", "completed", "on_hold"]
+PRIORITIES = ["low", "medium", "high", "critical"]
+CATEGORIES = ["Frontend", "Backend", "Database", "DevOps", "Security", "Monitoring"]
+TECHNOLOGIES = ["React", "FastAPI", "PostgreSQL", "Kubernetes", "Redis", "Terraform", "Grafana"]
+
+
+def make_tasks_payload(rows: int) -> bytes:
+    rng = random.Random(42)
+    tasks = [
+        {
+            "id": i,
+            "task_id": f"TASK-{i:04}",
+            "task": f"Learn feature {i}",
+            "description": "Work through the official tutorial and build a small demo",
+            "technology": rng.choice(TECHNOLOGIES),
+            "subcategory": "Frameworks",
+            "category": rng.choice(CATEGORIES),
+            "topics": ["basics", "testing"],
+            "section": "Core",
+            "source": "Official Docs",
+            "level": "intermediate",
+            "type": "learning",
+            "status": rng.choice(STATUSES),
+            "priority": rng.choice(PRIORITIES),
+            "progress": rng.randint(0, 100),
+            "order": i,
+            "due_date": None,
+            "start_date": "2025-04-01",
+            "end_date": None,
+            "estimated_duration": rng.randint(1, 20),
+            "actual_duration": None,
+            "done": False,
+        }
+        for i in range(rows)
+    ]
+    return json.dumps(tasks).encode()
+
+
+def make_app(body: bytes, chunk_size: int):
+    async def app(scope, receive, send):
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+        })
+        if not chunk_size:
+            await send({"type": "http.response.body", "body": body})
+            return
+        for offset in range(0, len(body), chunk_size):
+            chunk = body[offset:offset + chunk_size]
+            await send({"type": "http.response.body", "body": chunk, "more_body": offset + chunk_size < len(body)})
+    return app
+
+
+async def run_request(middleware, accept_encoding: str) -> int:
+    scope = {"type": "http", "headers": [(b"accept-encoding", accept_encoding.encode())]}
+    sent = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        nonlocal sent
+        if message["type"] == "http.response.body":
+            sent += len(message.get("body", b""))
+
+    await middleware(scope, receive, send)
+    return sent
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--chunk-size", type=int, default=0, help="stream the body in chunks of this size")
+    args = parser.parse_args()
+
+    body = make_tasks_payload(args.rows)
+    middleware = CompressionMiddleware(make_app(body, args.chunk_size))
+
+    print(f"rows={args.rows} raw={len(body)} bytes chunk_size={args.chunk_size or 'none'}")
+    print(f"{'encoding':<10}{'bytes':>12}{'ratio':>8}{'cpu ms/req':>12}")
+    for encoding in ("identity", "gzip", "br"):
+        start = time.process_time()
+        for _ in range(args.requests):
+            sent = asyncio.run(run_request(middleware, encoding))
+        cpu_ms = (time.process_time() - start) * 1000 / args.requests
+        print(f"{encoding:<10}{sent:>12}{len(body) / sent:>8.1f}{cpu_ms:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+    Per-request CPU for the hot router queries: statements rebuilt on every
+    call (the old router code) vs the pre-built ones in database/statements,
+    with and without the engine's compiled cache.
+
+    Runs against in-memory SQLite so only the Python-side cost differs.
+    Run from the repo root:
+        python -m backend.benchmarks.statement_benchmark --iterations 2000
+"""
+import argparse
+import time
+
+from sqlalchemy import text
+from sqlalchemy.orm import selectinload
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from backend.database import statements
+from backend.database.models.task_models import Category, Subcategory, Task, TaskStatus, Technology, TechnologySubcategory, Topic
+
+
+def seed(session: Session):
+    session.add(Category(id=1, name="Backend"))
+    session.add(Subcategory(id=1, name="Web Frameworks", category_id=1))
+    session.add(TaskStatus(id=1, name="in_progress"))
+    for i in range(1, 21):
+        session.add(Technology(id=i, name=f"Tech {i}", description="A technology"))
+        session.add(TechnologySubcategory(technology_id=i, subcategory_id=1))
+    topics = [Topic(id=i, name=f"topic {i}") for i in range(1, 11)]
+    session.add_all(topics)
+    for i in range(1, 51):
+        session.add(Task(
+            id=i, task_id=f"TASK-{i:04}", task=f"Task {i}", description="Benchmark task",
+            technology_id=i % 20 + 1, subcategory_id=1, category_id=1, section="Core",
+            source_id=1, level_id=1, type_id=1, status_id=1, priority_id=1, progress=i % 100,
+            order=i, due_date=None, start_date=None, end_date=None, estimated_duration=4, actual_duration=None,
+            topics=[topics[i % 10], topics[(i + 3) % 10]],
+        ))
+    session.commit()
+
+
+def rebuilt_technologies(session: Session):
+    return session.exec(
+        select(
+            Technology.id.label("id"),
+            Technology.name.label("technology"),
+            Subcategory.name.label("subcategory"),
+            Category.name.label("category"),
+        )
+        .join(TechnologySubcategory, Technology.id == TechnologySubcategory.technology_id)
+        .join(Subcategory, TechnologySubcategory.subcategory_id == Subcategory.id)
+        .join(Category, Subcategory.category_id == Category.id)
+        .order_by(Technology.name, Category.name, Subcategory.name)
+    ).all()
+
+
+def rebuilt_in_detail(session: Session):
+    return session.exec(text("""
+        SELECT t.name AS technology, sc.name AS subcategory, c.name AS category, t.description
+        FROM technology t
+        JOIN technology_subcategory ts ON t.id = ts.technology_id
+        JOIN subcategory sc ON ts.subcategory_id = sc.id
+        JOIN category c ON sc.category_id = c.id
+        ORDER BY t.name, c.name, sc.name
+    """)).mappings().all()
+
+
+def rebuilt_lookup(session: Session):
+    return session.exec(select(TaskStatus).where(TaskStatus.name == "in_progress")).first()
+
+
+def rebuilt_tasks(session: Session):
+    return session.exec(select(Task).options(selectinload(Task.topics))).all()
+
+
+CASES = {
+    "GET /tasks/technologies": (
+        rebuilt_technologies,
+        lambda session: session.exec(statements.TECHNOLOGIES_WITH_HIERARCHY).all(),
+    ),
+    "GET /tasks/technologiesInDetail": (
+        rebuilt_in_detail,
+        lambda session: session.exec(statements.TECHNOLOGIES_IN_DETAIL).mappings().all(),
+    ),
+    "PUT /tasks/{id} lookup by name": (
+        rebuilt_lookup,
+        lambda session: session.exec(statements.BY_NAME[TaskStatus], params={"name": "in_progress"}).first(),
+    ),
+    "GET /tasks": (
+        rebuilt_tasks,
+        lambda session: session.exec(statements.TASKS_WITH_TOPICS).all(),
+    ),
+}
+
+
+def measure(engine, func, iterations: int) -> float:
+    with Session(engine) as session:
+        # Warms the compiled cache, and guards against timing empty results
+        assert func(session), "benchmark query returned no rows"
+        start = time.process_time()
+        for _ in range(iterations):
+            func(session)
+        return (time.process_time() - start) * 1_000_000 / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    cached = create_engine("sqlite://")
+    uncached = create_engine("sqlite://", query_cache_size=0)
+    for engine in (cached, uncached):
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            seed(session)
+
+    print(f"{'endpoint':<34}{'no cache':>12}{'rebuilt':>12}{'pre-built':>12}   (us/request)")
+    for name, (rebuilt, prebuilt) in CASES.items():
+        print(
+            f"{name:<34}"
+            f"{measure(uncached, rebuilt, args.iterations):>12.1f}"
+            f"{measure(cached, rebuilt, args.iterations):>12.1f}"
+            f"{measure(cached, prebuilt, args.iterations):>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
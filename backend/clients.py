@@ -0,0 +1,57 @@
+import math
+import os
+import threading
+import time
+from fastapi import Request, Response
+
+# Comma-separated addresses of reverse proxies allowed to set X-Forwarded-For
+TRUSTED_PROXIES = {address.strip() for address in os.environ.get("TRUSTED_PROXIES", "").split(",") if address.strip()}
+
+# How long after a write a client's reads are pinned to the primary
+READ_YOUR_WRITES_SECONDS = float(os.environ.get("READ_YOUR_WRITES_SECONDS", "10"))
+
+# Wall-clock time of the client's last write. Every API process can read it,
+# unlike recent_writers, which only the process that served the write sees
+WROTE_AT_COOKIE = "wrote_at"
+
+recent_writers = {}
+writers_lock = threading.Lock()
+
+
+def client_id(request: Request) -> str:
+    peer = request.client.host if request.client else "unknown"
+    forwarded = request.headers.get("x-forwarded-for")
+    if not forwarded or peer not in TRUSTED_PROXIES:
+        # Anyone can send X-Forwarded-For; only our own proxies are believed
+        return peer
+
+    # Walk back from the nearest hop; the first address not belonging to a
+    # trusted proxy is the real client. Hops before it are client-controlled.
+    for address in reversed([hop.strip() for hop in forwarded.split(",")]):
+        if address and address not in TRUSTED_PROXIES:
+            return address
+    return peer
+
+def mark_recent_writer(request: Request, response: Response):
+    response.set_cookie(
+        WROTE_AT_COOKIE, str(time.time()),
+        max_age=math.ceil(READ_YOUR_WRITES_SECONDS), httponly=True, samesite="lax",
+    )
+    # Kept for clients that drop cookies; covers reads served by this process
+    now = time.monotonic()
+    with writers_lock:
+        recent_writers[client_id(request)] = now
+        if len(recent_writers) > 10_000:
+            for client, wrote_at in list(recent_writers.items()):
+                if now - wrote_at > READ_YOUR_WRITES_SECONDS:
+                    del recent_writers[client]
+
+def is_recent_writer(request: Request) -> bool:
+    try:
+        wrote_at = float(request.cookies.get(WROTE_AT_COOKIE, ""))
+    except ValueError:
+        wrote_at = None
+    if wrote_at is not None and 0 <= time.time() - wrote_at < READ_YOUR_WRITES_SECONDS:
+        return True
+    wrote_at = recent_writers.get(client_id(request))
+    return wrote_at is not None and time.monotonic() - wrote_at < READ_YOUR_WRITES_SECONDS
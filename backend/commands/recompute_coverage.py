@@ -0,0 +1,35 @@
+"""
+    Recompute coverage rollups from the task table and verify the stored ones.
+
+    Run from the repo root:
+        python -m backend.commands.recompute_coverage          # verify only
+        python -m backend.commands.recompute_coverage --fix    # verify and repair
+"""
+import argparse
+import sys
+
+from sqlmodel import Session
+
+from backend.database.connection import engine
+from backend.routers.coverage import recompute_coverage
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--fix", action="store_true", help="replace stored rollups with the recomputed ones")
+    args = parser.parse_args()
+
+    with Session(engine) as session:
+        mismatches = recompute_coverage(session, fix=args.fix)
+        if args.fix:
+            session.commit()
+
+    for line in mismatches:
+        print(line)
+    print(f"{len(mismatches)} mismatched node(s){', repaired' if args.fix and mismatches else ''}")
+    if mismatches and not args.fix:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+-- Run before starting the API: SQLModel's create_all skips tables that already
+-- exist, so task_event keeps its partitioned layout.
+-- Then baseline tasks that predate the history table with a job:
+--   POST /api/jobs {"kind": "backfill_task_history"}
+-- Partitions are created 12 months ahead here; schedule the partition job at
+-- least monthly so rows never fall into task_event_default (a month with rows
+-- in the default partition can no longer get its own partition):
+--   POST /api/jobs {"kind": "ensure_task_event_partitions", "payload": {"months_ahead": 12}}
+
+-- Append-only task history, range-partitioned by month on event_date
+CREATE TABLE task_event (
+    id BIGSERIAL,
+    event_date DATE NOT NULL,
+    occurred_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    task_id INTEGER NOT NULL,
+    event_type VARCHAR(16) NOT NULL,
+    category_id INTEGER NOT NULL,
+    technology_id INTEGER NOT NULL,
+    status_id INTEGER NOT NULL,
+    progress INTEGER NOT NULL,
+    done BOOLEAN NOT NULL,
+    progress_delta INTEGER NOT NULL DEFAULT 0,
+    previous_category_id INTEGER,
+    previous_technology_id INTEGER,
+    previous_progress INTEGER,
+    previous_done BOOLEAN,
+    PRIMARY KEY (id, event_date)
+) PARTITION BY RANGE (event_date);
+
+CREATE TABLE task_event_default PARTITION OF task_event DEFAULT;
+
+-- Create one partition per month, starting from the current month
+CREATE OR REPLACE FUNCTION create_task_event_partitions(months_ahead INTEGER)
+RETURNS VOID AS $$
+DECLARE
+    month_start DATE;
+BEGIN
+    FOR i IN 0..months_ahead LOOP
+        month_start := date_trunc('month', CURRENT_DATE)::DATE + make_interval(months => i);
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF task_event FOR VALUES FROM (%L) TO (%L)',
+            'task_event_' || to_char(month_start, 'YYYY_MM'),
+            month_start,
+            (month_start + INTERVAL '1 month')::DATE
+        );
+    END LOOP;
+END;
+$$ language 'plpgsql';
+
+SELECT create_task_event_partitions(12);
+
+CREATE INDEX ix_task_event_task_id ON task_event(task_id);
+
+-- Daily counters per category/technology, upserted with every task_event row
+CREATE TABLE task_daily_rollup (
+    day DATE NOT NULL,
+    category_id INTEGER NOT NULL,
+    technology_id INTEGER NOT NULL,
+    tasks_added INTEGER NOT NULL DEFAULT 0,
+    tasks_completed INTEGER NOT NULL DEFAULT 0,
+    progress_delta INTEGER NOT NULL DEFAULT 0,
+    events INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, category_id, technology_id)
+);
+
+COMMENT ON TABLE task_event IS 'Append-only history of task progress, status and done changes';
+COMMENT ON TABLE task_daily_rollup IS 'Net daily task counters backing /api/analytics burndown and velocity';
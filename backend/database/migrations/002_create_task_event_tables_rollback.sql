@@ -0,0 +1,6 @@
+-- Drop rollups first, then the partitioned history table and its partitions
+DROP TABLE IF EXISTS task_daily_rollup;
+DROP TABLE IF EXISTS task_event CASCADE;
+
+-- Drop partition helper
+DROP FUNCTION IF EXISTS create_task_event_partitions(INTEGER);
@@ -0,0 +1,25 @@
+-- create_all only creates missing tables, so existing databases need these
+-- indexes added by hand. Backfill counts afterwards with a job:
+--   POST /api/jobs {"kind": "rebuild_topic_index"}
+
+-- topic -> tasks lookups (the primary key only serves task -> topics)
+CREATE INDEX IF NOT EXISTS ix_task_topic_topic_id_task_id ON task_topic(topic_id, task_id);
+
+-- Case-insensitive prefix search for autocomplete
+CREATE INDEX IF NOT EXISTS ix_topic_lower_name ON topic(lower(name) text_pattern_ops);
+
+CREATE TABLE IF NOT EXISTS topic_usage (
+    topic_id INTEGER PRIMARY KEY REFERENCES topic(id),
+    task_count INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS ix_topic_usage_task_count ON topic_usage(task_count);
+
+CREATE TABLE IF NOT EXISTS topic_cooccurrence (
+    topic_id INTEGER NOT NULL REFERENCES topic(id),
+    related_topic_id INTEGER NOT NULL REFERENCES topic(id),
+    task_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (topic_id, related_topic_id)
+);
+
+COMMENT ON TABLE topic_usage IS 'Number of tasks linked to each topic, maintained on every task_topic change';
+COMMENT ON TABLE topic_cooccurrence IS 'Number of tasks sharing each pair of topics, stored in both directions';
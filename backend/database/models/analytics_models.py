@@ -0,0 +1,61 @@
+from datetime import date, datetime
+from sqlmodel import Field, SQLModel
+from typing import Optional
+
+"""
+    TASK HISTORY
+"""
+# Append-only; partitioned by event_date in PostgreSQL (see migrations/002).
+# task_id is deliberately not a foreign key so history outlives deleted tasks.
+class TaskEvent(SQLModel, table=True):
+    __tablename__ = "task_event"
+
+    id: Optional[int] = Field(default=None, primary_key=True, sa_column_kwargs={"autoincrement": True})
+    event_date: date = Field(primary_key=True)
+    occurred_at: datetime
+    task_id: int = Field(index=True)
+    event_type: str  # created | updated | deleted
+    category_id: int
+    technology_id: int
+    status_id: int
+    progress: int
+    done: bool
+    progress_delta: int = 0
+    # State before the change (null for created), so rollups can be replayed exactly
+    previous_category_id: Optional[int] = None
+    previous_technology_id: Optional[int] = None
+    previous_progress: Optional[int] = None
+    previous_done: Optional[bool] = None
+
+
+"""
+    DAILY ROLLUPS
+"""
+# One row per day/category/technology, upserted alongside each TaskEvent
+class TaskDailyRollup(SQLModel, table=True):
+    __tablename__ = "task_daily_rollup"
+
+    day: date = Field(primary_key=True)
+    category_id: int = Field(primary_key=True)
+    technology_id: int = Field(primary_key=True)
+    tasks_added: int = 0
+    tasks_completed: int = 0
+    progress_delta: int = 0
+    events: int = 0
+
+
+"""
+    COVERAGE ROLLUPS
+"""
+# One row per category, category/subcategory and category/subcategory/technology
+# node; 0 stands in for the levels above the node. Upserted on every task write.
+class CoverageRollup(SQLModel, table=True):
+    __tablename__ = "coverage_rollup"
+
+    category_id: int = Field(primary_key=True)
+    subcategory_id: int = Field(default=0, primary_key=True)
+    technology_id: int = Field(default=0, primary_key=True)
+    task_count: int = 0
+    done_count: int = 0
+    weight_total: int = 0       # sum of estimated_duration (1 when unset)
+    weighted_progress: int = 0  # sum of weight * progress, done counting as 100
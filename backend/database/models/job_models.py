@@ -0,0 +1,33 @@
+from datetime import datetime
+from sqlalchemy import JSON, Column, DateTime, Index, text
+from sqlmodel import Field, SQLModel
+from typing import Any, Dict, Optional
+
+"""
+    BACKGROUND JOBS
+"""
+class Job(SQLModel, table=True):
+    __tablename__ = "job"
+    # Workers claim from here with FOR UPDATE SKIP LOCKED
+    __table_args__ = (
+        Index("ix_job_queue", text("priority DESC"), "id", postgresql_where=text("status = 'queued'")),
+        Index("ix_job_lease", "locked_until", postgresql_where=text("status = 'running'")),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    kind: str
+    status: str = "queued"  # queued | running | succeeded | failed
+    priority: int = 0       # higher runs first
+    payload: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSON, nullable=False))
+    result: Optional[Dict[str, Any]] = Field(default=None, sa_column=Column(JSON))
+    error: Optional[str] = None
+    progress: int = 0
+    attempts: int = 0
+    max_attempts: int = 3
+    locked_by: Optional[str] = None
+    # Renewed by the running worker; once it lapses another worker may reclaim the job
+    locked_until: Optional[datetime] = Field(default=None, sa_type=DateTime(timezone=True))
+    run_after: datetime = Field(sa_type=DateTime(timezone=True))
+    created_at: datetime = Field(sa_type=DateTime(timezone=True))
+    started_at: Optional[datetime] = Field(default=None, sa_type=DateTime(timezone=True))
+    finished_at: Optional[datetime] = Field(default=None, sa_type=DateTime(timezone=True))
@@ -1,4 +1,5 @@
 from datetime import date
+from sqlalchemy import Index, func
 from sqlmodel import Field, Relationship, SQLModel
 from typing import List, Optional
 
@@ -7,6 +8,8 @@ from typing import List, Optional
 """
 class TaskTopicLink(SQLModel, table=True):
     __tablename__ = "task_topic"
+    # The primary key covers task -> topics; this covers topic -> tasks
+    __table_args__ = (Index("ix_task_topic_topic_id_task_id", "topic_id", "task_id"),)
 
     task_id: Optional[int] = Field(default=None, foreign_key="task.id", primary_key=True)
     topic_id: Optional[int] = Field(default=None, foreign_key="topic.id", primary_key=True)
@@ -64,6 +67,13 @@ class Topic(SQLModel, table=True):
 
     tasks: List["Task"] = Relationship(back_populates="topics", link_model=TaskTopicLink)
 
+# Serves case-insensitive prefix search for autocomplete
+Index(
+    "ix_topic_lower_name",
+    func.lower(Topic.name).label("lower_name"),
+    postgresql_ops={"lower_name": "text_pattern_ops"},
+)
+
 class Section(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str
@@ -97,6 +107,25 @@ class TaskPriority(SQLModel, table=True):
     name: str
 
 
+"""
+    TOPIC INDEX
+    Maintained incrementally whenever task_topic links change
+"""
+class TopicUsage(SQLModel, table=True):
+    __tablename__ = "topic_usage"
+
+    topic_id: int = Field(foreign_key="topic.id", primary_key=True)
+    task_count: int = Field(default=0, index=True)
+
+# Symmetric: each pair of topics sharing a task is stored in both directions
+class TopicCooccurrence(SQLModel, table=True):
+    __tablename__ = "topic_cooccurrence"
+
+    topic_id: int = Field(foreign_key="topic.id", primary_key=True)
+    related_topic_id: int = Field(foreign_key="topic.id", primary_key=True)
+    task_count: int = 0
+
+
 """
     DEPENDENCY RELATIONSHIPS
 """
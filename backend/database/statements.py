@@ -0,0 +1,69 @@
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm import selectinload
+from sqlmodel import select
+
+from backend.database.models.task_models import Category, Source, Subcategory, Task, TaskLevel, TaskPriority, TaskStatus, TaskType, Technology, TechnologySubcategory, Topic
+
+"""
+    Pre-built statements for hot queries. Built once at import and run
+    with bound params, so requests skip statement construction and hit
+    the engine's compiled cache instead of recompiling.
+"""
+
+TASKS_WITH_TOPICS = select(Task).options(selectinload(Task.topics))
+
+TASK_BY_ID = select(Task).where(Task.id == bindparam("id"))
+
+TASK_BY_TASK_ID = select(Task).where(Task.task_id == bindparam("task_id"))
+
+# Writers lock the row before snapshotting it, so concurrent updates to one
+# task apply their rollup deltas in sequence instead of from the same base
+TASK_BY_ID_FOR_UPDATE = TASK_BY_ID.with_for_update()
+
+TASK_BY_TASK_ID_FOR_UPDATE = TASK_BY_TASK_ID.with_for_update()
+
+TOPICS_BY_NAMES = select(Topic).where(Topic.name.in_(bindparam("names", expanding=True)))
+
+TOPIC_BY_NAME = select(Topic).where(Topic.name == bindparam("name"))
+
+# Lookup tables: list everything, or resolve a display name to its row
+LOOKUP_MODELS = (TaskPriority, TaskStatus, TaskType, TaskLevel, Technology, Category, Subcategory, Source)
+
+ALL_ROWS = {model: select(model) for model in LOOKUP_MODELS}
+
+BY_NAME = {model: select(model).where(model.name == bindparam("name")) for model in LOOKUP_MODELS}
+
+SUBCATEGORIES_BY_CATEGORY = select(Subcategory).where(Subcategory.category_id == bindparam("category_id"))
+
+TECHNOLOGIES_BY_SUBCATEGORY = (
+    select(Technology)
+    .join(TechnologySubcategory, Technology.id == TechnologySubcategory.technology_id)
+    .where(TechnologySubcategory.subcategory_id == bindparam("subcategory_id"))
+)
+
+TECHNOLOGIES_WITH_HIERARCHY = (
+    select(
+        Technology.id.label("id"),
+        Technology.name.label("technology"),
+        Subcategory.name.label("subcategory"),
+        Category.name.label("category"),
+    )
+    .join(TechnologySubcategory, Technology.id == TechnologySubcategory.technology_id)
+    .join(Subcategory, TechnologySubcategory.subcategory_id == Subcategory.id)
+    .join(Category, Subcategory.category_id == Category.id)
+    .order_by(Technology.name, Category.name, Subcategory.name)
+)
+
+# Kept as text(): a Core select measured slower here. Built once, so the
+# SQL string is not re-parsed for bind params on every request.
+TECHNOLOGIES_IN_DETAIL = text("""
+    SELECT t.name AS technology,
+           sc.name AS subcategory,
+           c.name AS category,
+           t.description
+    FROM technology t
+    JOIN technology_subcategory ts ON t.id = ts.technology_id
+    JOIN subcategory sc ON ts.subcategory_id = sc.id
+    JOIN category c ON sc.category_id = c.id
+    ORDER BY t.name, c.name, sc.name
+""")
@@ -0,0 +1,22 @@
+from datetime import date
+from pydantic import BaseModel
+from typing import List
+
+
+class BurndownPoint(BaseModel):
+    date: date
+    total: int
+    completed: int
+    remaining: int
+
+class BurndownResponse(BaseModel):
+    points: List[BurndownPoint]
+
+class VelocityPoint(BaseModel):
+    week_start: date
+    tasks_completed: int
+    progress: int
+
+class VelocityResponse(BaseModel):
+    weeks: List[VelocityPoint]
+    average_tasks_completed: float
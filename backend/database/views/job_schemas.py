@@ -0,0 +1,24 @@
+from datetime import datetime
+from pydantic import BaseModel
+from typing import Any, Dict, Optional
+
+
+class JobCreate(BaseModel):
+    kind: str
+    payload: Dict[str, Any] = {}
+    priority: int = 0
+    max_attempts: int = 3
+
+class JobRead(BaseModel):
+    id: int
+    kind: str
+    status: str
+    priority: int
+    progress: int
+    attempts: int
+    max_attempts: int
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
@@ -48,4 +48,16 @@ class CoverageItem(BaseModel):
 
 class CoverageResponse(BaseModel):
     items: List[CoverageItem]
-    overallProgress: int
\ No newline at end of file
+    overallProgress: int
+
+class CoverageNode(BaseModel):
+    id: int
+    name: str
+    percentage: int
+    task_count: int
+    done_count: int
+
+class CategoryCoverageResponse(BaseModel):
+    category: CoverageNode
+    subcategories: List[CoverageNode]
+    technologies: List[CoverageNode]
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import date
 from sqlmodel import SQLModel
 
@@ -74,4 +74,12 @@ class TaskUpdate(SQLModel):
     end_date: Optional[date]
     estimated_duration: Optional[int]
     actual_duration: Optional[int]
-    done: bool = False
\ No newline at end of file
+    done: bool = False
+
+
+# Column arrays for GET /api/tasks?format=columnar. Lookup columns hold
+# integer codes into `dictionaries`; topics hold a list of codes per row.
+class TaskColumnarRead(SQLModel):
+    row_count: int
+    columns: Dict[str, List[Any]]
+    dictionaries: Dict[str, List[str]]
\ No newline at end of file
@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+
+class TopicRead(BaseModel):
+    id: int
+    name: str
+    task_count: int
@@ -0,0 +1,214 @@
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+from sqlalchemy import text
+from sqlmodel import Session, delete, func, select
+from backend.database.connection import engine
+from backend.database.models.analytics_models import TaskDailyRollup, TaskEvent
+from backend.database.models.task_models import Task, TopicCooccurrence, TopicUsage
+from backend.jobs.runner import JobContext, job_handler
+from backend.routers.analytics import bump_rollup, rollup_deltas, task_snapshot
+from backend.routers.coverage import recompute_coverage
+
+SNAPSHOT_FIELDS = ("category_id", "technology_id", "status_id", "progress", "done")
+
+"""
+    Maintenance jobs
+"""
+
+@job_handler("rebuild_daily_rollups")
+def rebuild_daily_rollups(ctx: JobContext, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+        Replay task_event into fresh task_daily_rollup rows. The bulk of the
+        replay runs unlocked up to a watermark; only the catch-up and the swap
+        block live rollup upserts.
+    """
+    session = ctx.session
+    watermark = task_event_watermark()
+    total = session.exec(select(func.count()).select_from(TaskEvent).where(TaskEvent.id <= watermark)).one()
+
+    rollups = defaultdict(lambda: [0, 0, 0, 0])  # added, completed, progress, events
+    previous: Dict[int, Dict] = {}
+    events = session.exec(
+        select(TaskEvent)
+        .where(TaskEvent.id <= watermark)
+        .order_by(TaskEvent.task_id, TaskEvent.occurred_at, TaskEvent.id)
+        .execution_options(yield_per=1000)
+    )
+    for n, event in enumerate(events, start=1):
+        replay_event(event, rollups, previous)
+        if n % 10_000 == 0:
+            ctx.report_progress(n * 90 // total)
+
+    # Hold off live rollup upserts until the swap commits; otherwise events
+    # written after the catch-up read would be wiped by the delete below
+    session.exec(text("LOCK TABLE task_daily_rollup IN SHARE ROW EXCLUSIVE MODE"))
+    caught_up = 0
+    for caught_up, event in enumerate(session.exec(
+        select(TaskEvent)
+        .where(TaskEvent.id > watermark)
+        .order_by(TaskEvent.task_id, TaskEvent.occurred_at, TaskEvent.id)
+    ), start=1):
+        replay_event(event, rollups, previous)
+
+    session.exec(delete(TaskDailyRollup))
+    session.add_all(
+        TaskDailyRollup(
+            day=day, category_id=category_id, technology_id=technology_id,
+            tasks_added=added, tasks_completed=completed, progress_delta=progress, events=count,
+        )
+        for (day, category_id, technology_id), (added, completed, progress, count) in rollups.items()
+    )
+    # The runner commits together with the job's success, so the swap is atomic
+    return {"events": total + caught_up, "rollup_rows": len(rollups)}
+
+
+@job_handler("backfill_task_history")
+def backfill_task_history(ctx: JobContext, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+        Give every task without a `created` event a baseline one, so burndown
+        totals include tasks that predate the history table. Idempotent.
+    """
+    session = ctx.session
+    watermark = task_event_watermark()
+
+    has_created = select(TaskEvent.task_id).where(TaskEvent.event_type == "created", TaskEvent.id <= watermark)
+    first_events: Dict[int, TaskEvent] = {}
+    for event in session.exec(
+        select(TaskEvent)
+        .where(TaskEvent.task_id.not_in(has_created), TaskEvent.id <= watermark)
+        .order_by(TaskEvent.task_id, TaskEvent.occurred_at, TaskEvent.id)
+    ):
+        first_events.setdefault(event.task_id, event)
+    tasks = session.exec(select(Task).where(Task.id.not_in(has_created))).all()
+
+    # Blocks live rollup upserts until commit, so no task changes between
+    # the catch-up below and counting its baseline
+    session.exec(text("LOCK TABLE task_daily_rollup IN SHARE ROW EXCLUSIVE MODE"))
+    now = datetime.now(timezone.utc)
+    for event in session.exec(
+        select(TaskEvent)
+        .where(TaskEvent.id > watermark)
+        .order_by(TaskEvent.task_id, TaskEvent.occurred_at, TaskEvent.id)
+    ):
+        if event.event_type == "created":
+            first_events[event.task_id] = None  # new task, or baselined by another run
+        else:
+            # A task read from the task table has since changed; its first
+            # event's previous_* holds the state it had when read
+            first_events.setdefault(event.task_id, event)
+
+    baselines = []
+    for task_id, event in first_events.items():
+        if event is None:
+            continue
+        snapshot = previous_snapshot(event)
+        if snapshot is None:
+            snapshot = {field: getattr(event, field) for field in SNAPSHOT_FIELDS}
+            snapshot["progress"] -= event.progress_delta
+        baselines.append((task_id, snapshot, event.event_date, event.occurred_at - timedelta(microseconds=1)))
+    for task in tasks:
+        if task.id not in first_events:
+            baselines.append((task.id, task_snapshot(task), now.date(), now))
+
+    for n, (task_id, snapshot, day, occurred_at) in enumerate(baselines, start=1):
+        session.add(TaskEvent(
+            event_date=day, occurred_at=occurred_at, task_id=task_id, event_type="created", **snapshot,
+        ))
+        for bucket, added, completed, progress in rollup_deltas(None, snapshot):
+            bump_rollup(session, day, bucket, added=added, completed=completed, progress=progress)
+        if n % 1000 == 0:
+            ctx.report_progress(n * 100 // len(baselines))
+
+    return {"baselined": len(baselines)}
+
+
+def task_event_watermark() -> int:
+    """
+        Highest task_event id such that every event up to it is committed.
+        record_task_event bumps the rollup before inserting its event, so once
+        the lock is granted no writer holds an uncommitted event; the lock is
+        released as soon as the id is read.
+    """
+    with Session(engine) as session:
+        session.exec(text("LOCK TABLE task_daily_rollup IN SHARE ROW EXCLUSIVE MODE"))
+        return session.exec(select(func.coalesce(func.max(TaskEvent.id), 0))).one()
+
+
+def replay_event(event: TaskEvent, rollups: Dict, previous: Dict[int, Dict]):
+    snapshot = {field: getattr(event, field) for field in SNAPSHOT_FIELDS}
+    before = None
+    if event.event_type != "created":
+        before = previous_snapshot(event) or previous.get(event.task_id)
+    if before is None and event.event_type != "created":
+        # Legacy event without previous_* columns, on a task whose earlier
+        # state was never recorded: best guess is an in-place progress change
+        before = dict(snapshot, progress=event.progress - event.progress_delta)
+
+    after = None if event.event_type == "deleted" else snapshot
+    for bucket, added, completed, progress in rollup_deltas(before, after):
+        counters = rollups[(event.event_date, bucket["category_id"], bucket["technology_id"])]
+        counters[0] += added
+        counters[1] += completed
+        counters[2] += progress
+        counters[3] += 1
+    previous[event.task_id] = snapshot
+
+
+def previous_snapshot(event: TaskEvent) -> Optional[Dict]:
+    # Exactly the `before` that record_task_event saw when it wrote the event
+    if event.previous_category_id is None:
+        return None
+    return {
+        "category_id": event.previous_category_id,
+        "technology_id": event.previous_technology_id,
+        "status_id": event.status_id,
+        "progress": event.previous_progress,
+        "done": event.previous_done,
+    }
+
+
+@job_handler("rebuild_topic_index")
+def rebuild_topic_index(ctx: JobContext, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Recompute topic_usage and topic_cooccurrence from task_topic."""
+    session = ctx.session
+    # Same order as live writers take them; blocks their upserts until commit
+    session.exec(text("LOCK TABLE topic_usage, topic_cooccurrence IN SHARE ROW EXCLUSIVE MODE"))
+    session.exec(delete(TopicCooccurrence))
+    session.exec(delete(TopicUsage))
+    session.exec(text("""
+        INSERT INTO topic_usage (topic_id, task_count)
+        SELECT topic_id, COUNT(*) FROM task_topic GROUP BY topic_id
+    """))
+    ctx.report_progress(30)
+    session.exec(text("""
+        INSERT INTO topic_cooccurrence (topic_id, related_topic_id, task_count)
+        SELECT a.topic_id, b.topic_id, COUNT(*)
+        FROM task_topic a
+        JOIN task_topic b ON a.task_id = b.task_id AND a.topic_id <> b.topic_id
+        GROUP BY a.topic_id, b.topic_id
+    """))
+    return {
+        "topics": session.exec(select(func.count()).select_from(TopicUsage)).one(),
+        "pairs": session.exec(select(func.count()).select_from(TopicCooccurrence)).one(),
+    }
+
+
+@job_handler("ensure_task_event_partitions")
+def ensure_task_event_partitions(ctx: JobContext, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+        Create the monthly task_event partitions for the next payload["months_ahead"] months (default 12).
+        Run it at least monthly: once a month's rows land in task_event_default,
+        that month's partition can no longer be created.
+    """
+    months_ahead = int(payload.get("months_ahead", 12))
+    ctx.session.exec(text("SELECT create_task_event_partitions(:months_ahead)").bindparams(months_ahead=months_ahead))
+    return {"months_ahead": months_ahead}
+
+
+@job_handler("recompute_coverage")
+def recompute_coverage_rollups(ctx: JobContext, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Verify coverage_rollup against the task table, repairing it unless payload says {"fix": false}."""
+    mismatches = recompute_coverage(ctx.session, fix=payload.get("fix", True))
+    return {"mismatches": len(mismatches), "details": mismatches[:50]}
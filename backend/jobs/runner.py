@@ -0,0 +1,233 @@
+import logging
+import os
+import socket
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy import and_, or_, update
+from sqlmodel import Session, select
+from backend.database.connection import engine
+from backend.database.models.job_models import Job
+
+logger = logging.getLogger(__name__)
+
+# A worker renews its lease every LEASE_SECONDS / 3 while a job runs
+LEASE_SECONDS = 60
+
+JobHandler = Callable[["JobContext", Dict[str, Any]], Optional[Dict[str, Any]]]
+JOB_HANDLERS: Dict[str, JobHandler] = {}
+
+
+def job_handler(kind: str):
+    """Register a function as the handler for jobs of the given kind."""
+    def register(func: JobHandler) -> JobHandler:
+        JOB_HANDLERS[kind] = func
+        return func
+    return register
+
+
+class JobContext:
+    """Handed to a job handler: its own session plus progress reporting."""
+
+    def __init__(self, job_id: int, session: Session):
+        self.job_id = job_id
+        self.session = session
+
+    def report_progress(self, progress: int):
+        # Separate short transaction so progress is visible while the job runs
+        with Session(engine) as session:
+            job = session.get(Job, self.job_id)
+            job.progress = max(0, min(100, progress))
+            session.add(job)
+            session.commit()
+
+
+class JobRunner:
+    """
+        Polls the job table from a bounded thread pool. Claims use
+        FOR UPDATE SKIP LOCKED, so several API replicas can share one queue;
+        a job whose worker stops renewing its lease is reclaimed by another.
+    """
+
+    def __init__(self, max_workers: int = 2, poll_interval: float = 1.0):
+        self.max_workers = max_workers
+        self.poll_interval = poll_interval
+        self.stop_event = threading.Event()
+        self.executor: Optional[ThreadPoolExecutor] = None
+
+    def start(self):
+        self.stop_event.clear()
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="job-worker")
+        for n in range(self.max_workers):
+            self.executor.submit(self.work, f"{socket.gethostname()}:{os.getpid()}:{n}")
+
+    def stop(self):
+        self.stop_event.set()
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+    def work(self, worker_id: str):
+        while not self.stop_event.is_set():
+            try:
+                job_id = claim_next_job(worker_id)
+            except Exception:
+                logger.exception("Job worker %s failed to claim a job", worker_id)
+                job_id = None
+            if job_id is None:
+                self.stop_event.wait(self.poll_interval)
+                continue
+            try:
+                run_job(job_id, worker_id)
+            except Exception:
+                # e.g. the database went away while recording the outcome;
+                # keep the worker alive and let the job be retried later
+                logger.exception("Job worker %s failed while running job %s", worker_id, job_id)
+
+
+
+
+
+"""
+    Helper functions
+"""
+
+def enqueue_job(session: Session, kind: str, payload: Optional[Dict[str, Any]] = None, priority: int = 0, max_attempts: int = 3) -> Job:
+    if kind not in JOB_HANDLERS:
+        raise ValueError(f"Unknown job kind: {kind}")
+    now = datetime.now(timezone.utc)
+    job = Job(kind=kind, payload=payload or {}, priority=priority, max_attempts=max_attempts, run_after=now, created_at=now)
+    session.add(job)
+    session.commit()
+    session.refresh(job)
+    return job
+
+
+def claim_next_job(worker_id: str) -> Optional[int]:
+    with Session(engine) as session:
+        while True:
+            now = datetime.now(timezone.utc)
+            job = session.exec(
+                select(Job)
+                .where(or_(
+                    and_(Job.status == "queued", Job.run_after <= now),
+                    # Running, but its worker stopped renewing the lease (crashed replica)
+                    and_(Job.status == "running", Job.locked_until < now),
+                ))
+                .order_by(Job.priority.desc(), Job.id)
+                .limit(1)
+                .with_for_update(skip_locked=True)
+            ).first()
+            if job is None:
+                return None
+
+            if job.status == "running" and job.attempts >= job.max_attempts:
+                job.status = "failed"
+                job.error = f"Worker {job.locked_by} stopped renewing its lease on the last attempt"
+                job.finished_at = now
+                job.locked_by = None
+                job.locked_until = None
+                session.add(job)
+                session.commit()
+                continue
+
+            job.status = "running"
+            job.attempts += 1
+            job.started_at = now
+            job.locked_by = worker_id
+            job.locked_until = now + timedelta(seconds=LEASE_SECONDS)
+            session.add(job)
+            session.commit()
+            return job.id
+
+
+def renew_lease(job_id: int, worker_id: str) -> bool:
+    with Session(engine) as session:
+        result = session.exec(
+            update(Job)
+            .where(Job.id == job_id, Job.locked_by == worker_id)
+            .values(locked_until=datetime.now(timezone.utc) + timedelta(seconds=LEASE_SECONDS))
+        )
+        session.commit()
+        return result.rowcount == 1
+
+
+def keep_lease(job_id: int, worker_id: str, done: threading.Event):
+    while not done.wait(LEASE_SECONDS / 3):
+        try:
+            if not renew_lease(job_id, worker_id):
+                logger.warning("Worker %s lost the lease on job %s", worker_id, job_id)
+                return
+        except Exception:
+            logger.exception("Worker %s failed to renew the lease on job %s", worker_id, job_id)
+
+
+def lock_owned_job(session: Session, job_id: int, worker_id: str) -> Optional[Job]:
+    """Re-read the job under a row lock; None if another worker has taken it over."""
+    job = session.exec(
+        select(Job)
+        .where(Job.id == job_id)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    ).first()
+    if job is None or job.locked_by != worker_id:
+        logger.warning("Worker %s no longer owns job %s; discarding its outcome", worker_id, job_id)
+        return None
+    return job
+
+
+def run_job(job_id: int, worker_id: str):
+    done = threading.Event()
+    heartbeat = threading.Thread(target=keep_lease, args=(job_id, worker_id, done), daemon=True)
+    heartbeat.start()
+    try:
+        run_leased_job(job_id, worker_id)
+    finally:
+        done.set()
+        heartbeat.join()
+
+
+def run_leased_job(job_id: int, worker_id: str):
+    with Session(engine) as session:
+        job = session.get(Job, job_id)
+        if job is None:
+            logger.warning("Job %s disappeared before it could run", job_id)
+            return
+        kind, payload = job.kind, dict(job.payload)
+        handler = JOB_HANDLERS.get(kind)
+        try:
+            if handler is None:
+                raise ValueError(f"Unknown job kind: {kind}")
+            result = handler(JobContext(job_id, session), payload)
+        except Exception:
+            error = traceback.format_exc(limit=5)
+            session.rollback()
+            job = lock_owned_job(session, job_id, worker_id)
+            if job is None:
+                return
+            job.error = error
+            if job.attempts < job.max_attempts:
+                # Exponential backoff: 2s, 4s, 8s, ...
+                job.status = "queued"
+                job.run_after = datetime.now(timezone.utc) + timedelta(seconds=2 ** job.attempts)
+            else:
+                job.status = "failed"
+                job.finished_at = datetime.now(timezone.utc)
+            logger.warning("Job %s (%s) failed on attempt %s", job_id, kind, job.attempts)
+        else:
+            job = lock_owned_job(session, job_id, worker_id)
+            if job is None:
+                session.rollback()  # the handler's work goes with the lost lease
+                return
+            job.status = "succeeded"
+            job.result = result
+            job.error = None
+            job.progress = 100
+            job.finished_at = datetime.now(timezone.utc)
+        job.locked_by = None
+        job.locked_until = None
+        session.add(job)
+        session.commit()
@@ -3,18 +3,44 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from sqlmodel import SQLModel
 
-from backend.routers import tasks, other, topics
+from backend.routers import tasks, other, topics, analytics, jobs, coverage
 from backend.database.connection import engine
+from backend.jobs import handlers  # registers job handlers
+from backend.jobs.runner import JobRunner
+from backend.middleware.coalesce import CoalesceMiddleware
+from backend.middleware.compression import CompressionMiddleware
+from backend.middleware.rate_limit import RateLimitMiddleware
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     SQLModel.metadata.create_all(engine)
+    job_runner.start()
     yield
+    job_runner.stop()
+
+job_runner = JobRunner(max_workers=2, poll_interval=1.0)
 
 app = FastAPI(lifespan=lifespan)
 app.include_router(other.router, prefix="/api", tags=["other"])
 app.include_router(tasks.router, prefix="/api", tags=["tasks"])
 app.include_router(topics.router, prefix="/api", tags=["topics"])
+app.include_router(analytics.router, prefix="/api", tags=["analytics"])
+app.include_router(jobs.router, prefix="/api", tags=["jobs"])
+app.include_router(coverage.router, prefix="/api", tags=["coverage"])
+
+# Middleware added last runs first: rate limit before coalescing so every
+# request is charged against its client's budget, even when it shares a result
+app.add_middleware(CoalesceMiddleware)
+app.add_middleware(RateLimitMiddleware)
+
+# Compress outside the coalescer so shared responses are compressed per client encoding
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=1024,
+    content_types=("application/json", "text/"),
+    gzip_level=6,
+    brotli_quality=4,
+)
 
 # Configure CORS
 app.add_middleware(
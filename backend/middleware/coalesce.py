@@ -0,0 +1,83 @@
+import asyncio
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from fastapi import Request, Response
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from backend.clients import is_recent_writer
+
+# Expensive reads that every dashboard tab fires on load
+DEFAULT_COALESCED_PATHS = (
+    "/api/tasks/",
+    "/api/tasks/priorities",
+    "/api/tasks/statuses",
+    "/api/tasks/types",
+    "/api/tasks/levels",
+    "/api/tasks/sources",
+    "/api/tasks/categories",
+)
+
+CachedResponse = Tuple[int, List[Tuple[bytes, bytes]], bytes]
+
+
+class CoalesceMiddleware(BaseHTTPMiddleware):
+    """
+        Single-flight request coalescing: concurrent identical GETs share one
+        in-flight computation and its response. Nothing is cached once the
+        leading request completes, so later requests always see fresh data.
+    """
+
+    def __init__(self, app, paths: Optional[Iterable[str]] = None):
+        super().__init__(app)
+        paths = paths if paths is not None else DEFAULT_COALESCED_PATHS
+        self.paths = {p.rstrip("/") or "/" for p in paths}
+        self.in_flight: Dict[str, asyncio.Future] = {}
+
+    async def dispatch(self, request: Request, call_next):
+        if request.method != "GET" or (request.url.path.rstrip("/") or "/") not in self.paths:
+            return await call_next(request)
+        if is_recent_writer(request):
+            # An in-flight read may predate this client's write (or come from
+            # the replica), so read-your-writes requires a fresh computation
+            return await call_next(request)
+
+        key = request_key(request)
+        while (future := self.in_flight.get(key)) is not None:
+            try:
+                return build_response(await asyncio.shield(future))
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise  # this request itself was cancelled
+                # The leader was cancelled (e.g. its client went away): retry
+
+        future = self.in_flight[key] = asyncio.get_running_loop().create_future()
+        try:
+            response = await call_next(request)
+            body = b"".join([chunk async for chunk in response.body_iterator])
+            cached = (response.status_code, list(response.raw_headers), body)
+            future.set_result(cached)
+        except Exception as exc:
+            future.set_exception(exc)
+            future.exception()  # mark retrieved when there are no followers
+            raise
+        finally:
+            # Cancellation is a BaseException and skips the handler above;
+            # cancelling the future tells followers to retry on their own
+            if not future.done():
+                future.cancel()
+            del self.in_flight[key]
+        return build_response(cached)
+
+
+"""
+    Helper functions
+"""
+def request_key(request: Request) -> str:
+    return f"{request.url.path}?{request.url.query}"
+
+
+def build_response(cached: CachedResponse) -> Response:
+    status_code, raw_headers, body = cached
+    response = Response(content=body, status_code=status_code)
+    response.raw_headers = list(raw_headers)
+    return response
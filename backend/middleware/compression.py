@@ -0,0 +1,158 @@
+import zlib
+from typing import Iterable, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; fall back to gzip only
+    brotli = None
+
+DEFAULT_CONTENT_TYPES = ("application/json", "text/")
+
+
+class CompressionMiddleware:
+    """
+        Brotli/gzip response compression negotiated via Accept-Encoding.
+        Complete bodies under minimum_size are sent as-is; streaming bodies
+        are compressed chunk by chunk and flushed so clients see data early.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        content_types: Iterable[str] = DEFAULT_CONTENT_TYPES,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.content_types = tuple(content_types)
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = CompressingResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+
+class CompressingResponder:
+    def __init__(self, config: CompressionMiddleware, encoding: str, send: Send):
+        self.config = config
+        self.encoding = encoding
+        self.downstream = send
+        self.start_message: Optional[Message] = None
+        self.compressor = None
+        self.passthrough = False
+        self.buffer = []
+        self.buffered = 0
+
+    async def send(self, message: Message):
+        if message["type"] == "http.response.start":
+            # Hold the headers until enough body has arrived to decide
+            self.start_message = message
+            headers = Headers(raw=message["headers"])
+            self.passthrough = (
+                message["status"] < 200
+                or message["status"] in (204, 304)
+                or "content-encoding" in headers
+                or not headers.get("content-type", "").startswith(self.config.content_types)
+            )
+            return
+
+        if message["type"] != "http.response.body":
+            await self.downstream(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.start_message is None:
+            if self.compressor is not None:
+                body = self.compress(body, final=not more_body)
+            await self.downstream({"type": "http.response.body", "body": body, "more_body": more_body})
+            return
+
+        if self.passthrough:
+            await self.flush_start()
+            await self.downstream(message)
+            return
+
+        # Streaming responses (including everything behind BaseHTTPMiddleware)
+        # arrive in chunks, so buffer until the size threshold can be judged
+        self.buffer.append(body)
+        self.buffered += len(body)
+        if more_body and self.buffered < self.config.minimum_size:
+            return
+
+        body, self.buffer = b"".join(self.buffer), []
+        if not more_body and (not body or len(body) < self.config.minimum_size):
+            # Sent as the app framed it; any Content-Length it set still holds
+            await self.flush_start()
+            await self.downstream({"type": "http.response.body", "body": body, "more_body": False})
+            return
+
+        self.compressor = self.new_compressor()
+        headers = MutableHeaders(raw=self.start_message["headers"])
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        body = self.compress(body, final=not more_body)
+        if more_body:
+            del headers["Content-Length"]
+        else:
+            headers["Content-Length"] = str(len(body))
+        await self.flush_start()
+        await self.downstream({"type": "http.response.body", "body": body, "more_body": more_body})
+
+    async def flush_start(self):
+        start, self.start_message = self.start_message, None
+        await self.downstream(start)
+
+    def new_compressor(self):
+        if self.encoding == "br":
+            return brotli.Compressor(quality=self.config.brotli_quality)
+        return zlib.compressobj(self.config.gzip_level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        if self.encoding == "br":
+            out = self.compressor.process(data)
+            return out + (self.compressor.finish() if final else self.compressor.flush())
+        out = self.compressor.compress(data)
+        return out + self.compressor.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+"""
+    Helper functions
+"""
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    accepted = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+
+    # Highest q wins; listing br first breaks ties in its favour
+    supported = ("br", "gzip") if brotli is not None else ("gzip",)
+    best, best_quality = None, 0.0
+    for coding in supported:
+        quality = accepted.get(coding, accepted.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
@@ -0,0 +1,90 @@
+import math
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from backend.clients import client_id
+
+
+@dataclass
+class RouteBudget:
+    capacity: int           # max burst size
+    refill_per_second: float
+
+
+@dataclass
+class TokenBucket:
+    tokens: float
+    updated_at: float
+
+    def take(self, budget: RouteBudget, now: float) -> float:
+        """Take one token. Returns 0 on success, otherwise seconds until a token is available."""
+        self.tokens = min(budget.capacity, self.tokens + (now - self.updated_at) * budget.refill_per_second)
+        self.updated_at = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0
+        return (1 - self.tokens) / budget.refill_per_second
+
+
+# Longest matching prefix wins, so keep specific routes ahead of generic ones
+DEFAULT_BUDGETS: Dict[str, RouteBudget] = {
+    "/api/tasks/technologiesInDetail": RouteBudget(capacity=10, refill_per_second=2),
+    "/api/tasks": RouteBudget(capacity=30, refill_per_second=10),
+    "/api": RouteBudget(capacity=60, refill_per_second=20),
+}
+
+
+class RateLimitMiddleware(BaseHTTPMiddleware):
+    """
+        Per-client token-bucket rate limiter with per-route budgets.
+        Requests over budget get a 429 with a Retry-After header.
+    """
+
+    def __init__(self, app, budgets: Optional[Dict[str, RouteBudget]] = None, max_buckets: int = 10_000):
+        super().__init__(app)
+        self.budgets = budgets if budgets is not None else DEFAULT_BUDGETS
+        self.prefixes = sorted(self.budgets, key=len, reverse=True)
+        self.max_buckets = max_buckets
+        self.buckets: Dict[Tuple[str, str], TokenBucket] = {}
+
+    async def dispatch(self, request: Request, call_next):
+        prefix = self.match_prefix(request.url.path)
+        if prefix is None or request.method == "OPTIONS":
+            return await call_next(request)
+
+        budget = self.budgets[prefix]
+        key = (client_id(request), prefix)
+        now = time.monotonic()
+
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            if len(self.buckets) >= self.max_buckets:
+                self.evict_full_buckets(now)
+            bucket = self.buckets[key] = TokenBucket(tokens=budget.capacity, updated_at=now)
+
+        retry_after = bucket.take(budget, now)
+        if retry_after:
+            return JSONResponse(
+                status_code=429,
+                content={"detail": "Too many requests"},
+                headers={"Retry-After": str(math.ceil(retry_after))},
+            )
+        return await call_next(request)
+
+    def match_prefix(self, path: str) -> Optional[str]:
+        for prefix in self.prefixes:
+            if path == prefix or path.startswith(prefix.rstrip("/") + "/"):
+                return prefix
+        return None
+
+    def evict_full_buckets(self, now: float):
+        # A bucket that would be full again carries no state worth keeping
+        for key, bucket in list(self.buckets.items()):
+            budget = self.budgets[key[1]]
+            if bucket.tokens + (now - bucket.updated_at) * budget.refill_per_second >= budget.capacity:
+                del self.buckets[key]
\ No newline at end of file
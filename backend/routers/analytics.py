@@ -0,0 +1,217 @@
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from sqlmodel import Session, func, select
+from sqlalchemy.dialects.postgresql import insert
+from backend.database.connection import get_read_session
+
+from backend.database.models.analytics_models import TaskDailyRollup, TaskEvent
+from backend.database.models.task_models import Task
+from backend.database.views.analytics_schemas import BurndownPoint, BurndownResponse, VelocityPoint, VelocityResponse
+
+router = APIRouter(prefix="/analytics")
+
+# One point per day is built in Python, so the window is bounded
+MAX_BURNDOWN_DAYS = 366
+
+"""
+    Analytics: answered from task_daily_rollup only, never from task_event
+"""
+
+@router.get("/burndown", response_model=BurndownResponse)
+def get_burndown(
+    category_id: Optional[int] = None,
+    technology_id: Optional[int] = None,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    session: Session = Depends(get_read_session),
+):
+    end = end or utc_today()
+    start = start or end - timedelta(days=29)
+    if start > end:
+        raise HTTPException(status_code=400, detail="start must be on or before end")
+    if (end - start).days >= MAX_BURNDOWN_DAYS:
+        raise HTTPException(status_code=400, detail=f"window must span at most {MAX_BURNDOWN_DAYS} days")
+
+    # Everything before the window collapses into a single baseline row
+    total, completed = session.exec(
+        rollup_filter(
+            select(
+                func.coalesce(func.sum(TaskDailyRollup.tasks_added), 0),
+                func.coalesce(func.sum(TaskDailyRollup.tasks_completed), 0),
+            ).where(TaskDailyRollup.day < start),
+            category_id, technology_id,
+        )
+    ).one()
+
+    daily = {
+        day: (added, done)
+        for day, added, done in session.exec(
+            rollup_filter(
+                select(
+                    TaskDailyRollup.day,
+                    func.sum(TaskDailyRollup.tasks_added),
+                    func.sum(TaskDailyRollup.tasks_completed),
+                )
+                .where(TaskDailyRollup.day >= start, TaskDailyRollup.day <= end)
+                .group_by(TaskDailyRollup.day),
+                category_id, technology_id,
+            )
+        ).all()
+    }
+
+    points = []
+    day = start
+    while day <= end:
+        added, done = daily.get(day, (0, 0))
+        total += added
+        completed += done
+        points.append(BurndownPoint(date=day, total=total, completed=completed, remaining=total - completed))
+        day += timedelta(days=1)
+
+    return BurndownResponse(points=points)
+
+
+@router.get("/velocity", response_model=VelocityResponse)
+def get_velocity(
+    category_id: Optional[int] = None,
+    technology_id: Optional[int] = None,
+    weeks: int = Query(default=8, ge=1, le=104),
+    session: Session = Depends(get_read_session),
+):
+    today = utc_today()
+    first_week = today - timedelta(days=today.weekday()) - timedelta(weeks=weeks - 1)
+
+    rows = session.exec(
+        rollup_filter(
+            select(
+                TaskDailyRollup.day,
+                func.sum(TaskDailyRollup.tasks_completed),
+                func.sum(TaskDailyRollup.progress_delta),
+            )
+            .where(TaskDailyRollup.day >= first_week, TaskDailyRollup.day <= today)
+            .group_by(TaskDailyRollup.day),
+            category_id, technology_id,
+        )
+    ).all()
+
+    buckets = {first_week + timedelta(weeks=i): [0, 0] for i in range(weeks)}
+    for day, completed, progress in rows:
+        bucket = buckets[day - timedelta(days=day.weekday())]
+        bucket[0] += completed
+        bucket[1] += progress
+
+    points = [
+        VelocityPoint(week_start=week_start, tasks_completed=completed, progress=progress)
+        for week_start, (completed, progress) in buckets.items()
+    ]
+    return VelocityResponse(
+        weeks=points,
+        average_tasks_completed=sum(p.tasks_completed for p in points) / weeks,
+    )
+
+
+
+
+
+"""
+    Helper functions
+"""
+
+def utc_today() -> date:
+    # Events are dated in UTC, so windows must be too
+    return datetime.now(timezone.utc).date()
+
+
+def task_snapshot(task: Task) -> Dict:
+    return {
+        "category_id": task.category_id,
+        "technology_id": task.technology_id,
+        "status_id": task.status_id,
+        "progress": task.progress,
+        "done": task.done,
+    }
+
+
+def record_task_event(session: Session, task: Task, event_type: str, before: Optional[Dict] = None):
+    """
+        Append a TaskEvent and fold it into the daily rollups. Adds to the
+        session without committing, so it lands in the caller's transaction.
+    """
+    after = task_snapshot(task) if event_type != "deleted" else None
+    now = datetime.now(timezone.utc)
+    today = now.date()
+
+    # Bump buckets in key order so concurrent moves lock rows in the same order
+    deltas = sorted(rollup_deltas(before, after), key=lambda delta: (delta[0]["category_id"], delta[0]["technology_id"]))
+    for snapshot, added, completed, progress in deltas:
+        bump_rollup(session, today, snapshot, added=added, completed=completed, progress=progress)
+
+    # Inserted after the bumps: while rebuild_daily_rollups holds its lock on
+    # task_daily_rollup, no uncommitted event can sit below its watermark
+    current = after or before
+    session.add(TaskEvent(
+        event_date=today,
+        occurred_at=now,
+        task_id=task.id,
+        event_type=event_type,
+        progress_delta=(after["progress"] if after else 0) - (before["progress"] if before else 0),
+        previous_category_id=before and before["category_id"],
+        previous_technology_id=before and before["technology_id"],
+        previous_progress=before and before["progress"],
+        previous_done=before and before["done"],
+        **current,
+    ))
+
+
+def rollup_deltas(before: Optional[Dict], after: Optional[Dict]) -> List[Tuple[Dict, int, int, int]]:
+    """
+        (bucket snapshot, tasks_added, tasks_completed, progress_delta) per
+        rollup bucket touched. Counters are net: deleting a task or moving it
+        to another category/technology backs it out of the old bucket.
+    """
+    same_bucket = (
+        before is not None and after is not None
+        and before["category_id"] == after["category_id"]
+        and before["technology_id"] == after["technology_id"]
+    )
+    if same_bucket:
+        return [(after, 0, int(after["done"]) - int(before["done"]), after["progress"] - before["progress"])]
+
+    deltas = []
+    if before is not None:
+        deltas.append((before, -1, -int(before["done"]), -before["progress"]))
+    if after is not None:
+        deltas.append((after, 1, int(after["done"]), after["progress"]))
+    return deltas
+
+
+def bump_rollup(session: Session, day: date, snapshot: Dict, added: int = 0, completed: int = 0, progress: int = 0):
+    statement = insert(TaskDailyRollup).values(
+        day=day,
+        category_id=snapshot["category_id"],
+        technology_id=snapshot["technology_id"],
+        tasks_added=added,
+        tasks_completed=completed,
+        progress_delta=progress,
+        events=1,
+    )
+    statement = statement.on_conflict_do_update(
+        index_elements=["day", "category_id", "technology_id"],
+        set_={
+            "tasks_added": TaskDailyRollup.tasks_added + statement.excluded.tasks_added,
+            "tasks_completed": TaskDailyRollup.tasks_completed + statement.excluded.tasks_completed,
+            "progress_delta": TaskDailyRollup.progress_delta + statement.excluded.progress_delta,
+            "events": TaskDailyRollup.events + 1,
+        },
+    )
+    session.exec(statement)
+
+
+def rollup_filter(statement, category_id: Optional[int], technology_id: Optional[int]):
+    if category_id is not None:
+        statement = statement.where(TaskDailyRollup.category_id == category_id)
+    if technology_id is not None:
+        statement = statement.where(TaskDailyRollup.technology_id == technology_id)
+    return statement
@@ -0,0 +1,201 @@
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException
+
+from sqlmodel import Session, delete, select
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert
+from backend.database.connection import get_read_session
+
+from backend.database.models.analytics_models import CoverageRollup
+from backend.database.models.task_models import Category, Subcategory, Task, Technology
+from backend.database.views.other_schemas import CategoryCoverageResponse, CoverageNode, CoverageResponse
+
+router = APIRouter(prefix="/coverage")
+
+NodeKey = Tuple[int, int, int]  # (category_id, subcategory_id, technology_id)
+
+"""
+    Coverage: read from coverage_rollup, O(categories) for the overview
+"""
+
+@router.get("", response_model=CoverageResponse)
+def get_coverage(session: Session = Depends(get_read_session)):
+    rows = session.exec(
+        select(Category.name, CoverageRollup)
+        .outerjoin(CoverageRollup, (CoverageRollup.category_id == Category.id)
+                   & (CoverageRollup.subcategory_id == 0)
+                   & (CoverageRollup.technology_id == 0))
+        .order_by(Category.id)
+    ).all()
+
+    weight_total = sum(rollup.weight_total for _, rollup in rows if rollup)
+    weighted_progress = sum(rollup.weighted_progress for _, rollup in rows if rollup)
+    return {
+        "items": [{"category": name, "percentage": percentage(rollup)} for name, rollup in rows],
+        "overallProgress": round(weighted_progress / weight_total) if weight_total else 0,
+    }
+
+
+@router.get("/categories/{category_id}", response_model=CategoryCoverageResponse)
+def get_category_coverage(category_id: int, session: Session = Depends(get_read_session)):
+    category = session.get(Category, category_id)
+    if not category:
+        raise HTTPException(status_code=404, detail="Category not found")
+
+    rows = session.exec(
+        select(CoverageRollup, Subcategory.name, Technology.name)
+        .outerjoin(Subcategory, Subcategory.id == CoverageRollup.subcategory_id)
+        .outerjoin(Technology, Technology.id == CoverageRollup.technology_id)
+        .where(CoverageRollup.category_id == category_id, CoverageRollup.task_count > 0)
+        .order_by(Subcategory.name, Technology.name)
+    ).all()
+
+    summary = CoverageNode(id=category.id, name=category.name, percentage=0, task_count=0, done_count=0)
+    subcategories, technologies = [], []
+    for rollup, subcategory_name, technology_name in rows:
+        if rollup.subcategory_id == 0:
+            summary = coverage_node(category.id, category.name, rollup)
+        elif rollup.technology_id == 0:
+            subcategories.append(coverage_node(rollup.subcategory_id, subcategory_name, rollup))
+        else:
+            technologies.append(coverage_node(rollup.technology_id, technology_name, rollup))
+
+    return CategoryCoverageResponse(category=summary, subcategories=subcategories, technologies=technologies)
+
+
+
+
+
+"""
+    Helper functions
+"""
+
+def coverage_snapshot(task: Task) -> Dict:
+    # Callers load the task FOR UPDATE first; an unlocked read lets two
+    # concurrent writers both subtract the same old contribution
+    return {
+        "category_id": task.category_id,
+        "subcategory_id": task.subcategory_id,
+        "technology_id": task.technology_id,
+        "progress": task.progress,
+        "done": task.done,
+        "estimated_duration": task.estimated_duration,
+    }
+
+
+def contribution(snapshot: Dict) -> Tuple[int, int, int, int]:
+    """(task_count, done_count, weight_total, weighted_progress) for one task."""
+    weight = snapshot["estimated_duration"] if snapshot["estimated_duration"] and snapshot["estimated_duration"] > 0 else 1
+    progress = 100 if snapshot["done"] else max(0, min(100, snapshot["progress"] or 0))
+    return 1, int(snapshot["done"]), weight, weight * progress
+
+
+def node_keys(snapshot: Dict) -> List[NodeKey]:
+    category_id, subcategory_id = snapshot["category_id"], snapshot["subcategory_id"]
+    return [
+        (category_id, 0, 0),
+        (category_id, subcategory_id, 0),
+        (category_id, subcategory_id, snapshot["technology_id"]),
+    ]
+
+
+def record_coverage_change(session: Session, before: Optional[Dict], after: Optional[Dict]):
+    """
+        Move a task's contribution from the nodes of `before` to those of
+        `after` (either may be None for create/delete). Does not commit.
+    """
+    deltas = defaultdict(lambda: [0, 0, 0, 0])
+    for snapshot, sign in ((before, -1), (after, 1)):
+        if snapshot is None:
+            continue
+        values = contribution(snapshot)
+        for key in node_keys(snapshot):
+            for i, value in enumerate(values):
+                deltas[key][i] += sign * value
+
+    rows = [
+        {
+            "category_id": category_id, "subcategory_id": subcategory_id, "technology_id": technology_id,
+            "task_count": d[0], "done_count": d[1], "weight_total": d[2], "weighted_progress": d[3],
+        }
+        # Key order, so concurrent writers lock rows in the same order
+        for (category_id, subcategory_id, technology_id), d in sorted(deltas.items())
+        if any(d)
+    ]
+    if not rows:
+        return
+
+    statement = insert(CoverageRollup).values(rows)
+    session.exec(statement.on_conflict_do_update(
+        index_elements=["category_id", "subcategory_id", "technology_id"],
+        set_={
+            column: getattr(CoverageRollup, column) + getattr(statement.excluded, column)
+            for column in ("task_count", "done_count", "weight_total", "weighted_progress")
+        },
+    ))
+
+
+def recompute_coverage(session: Session, fix: bool = False) -> List[str]:
+    """
+        Recompute every node from the task table and compare it with the stored
+        rollups. Returns one line per mismatch; with fix=True the stored rollups
+        are replaced (the caller commits).
+    """
+    # Blocks live rollup upserts until commit: a task write either committed
+    # before the lock (and is in the read below) or applies its delta after
+    session.exec(text("LOCK TABLE coverage_rollup IN SHARE ROW EXCLUSIVE MODE"))
+
+    expected = defaultdict(lambda: [0, 0, 0, 0])
+    tasks = session.exec(
+        select(Task.category_id, Task.subcategory_id, Task.technology_id, Task.progress, Task.done, Task.estimated_duration)
+        .execution_options(yield_per=1000)
+    )
+    for category_id, subcategory_id, technology_id, progress, done, estimated_duration in tasks:
+        snapshot = {
+            "category_id": category_id, "subcategory_id": subcategory_id, "technology_id": technology_id,
+            "progress": progress, "done": done, "estimated_duration": estimated_duration,
+        }
+        values = contribution(snapshot)
+        for key in node_keys(snapshot):
+            for i, value in enumerate(values):
+                expected[key][i] += value
+
+    stored = {
+        (row.category_id, row.subcategory_id, row.technology_id):
+            [row.task_count, row.done_count, row.weight_total, row.weighted_progress]
+        for row in session.exec(select(CoverageRollup)).all()
+    }
+
+    mismatches = []
+    for key in sorted(set(expected) | set(stored)):
+        want, have = expected.get(key, [0, 0, 0, 0]), stored.get(key, [0, 0, 0, 0])
+        if want != have:
+            mismatches.append(f"node {key}: stored {have}, expected {want}")
+
+    if fix and mismatches:
+        session.exec(delete(CoverageRollup))
+        session.add_all(
+            CoverageRollup(
+                category_id=category_id, subcategory_id=subcategory_id, technology_id=technology_id,
+                task_count=d[0], done_count=d[1], weight_total=d[2], weighted_progress=d[3],
+            )
+            for (category_id, subcategory_id, technology_id), d in expected.items()
+        )
+    return mismatches
+
+
+def percentage(rollup: Optional[CoverageRollup]) -> int:
+    if rollup is None or not rollup.weight_total:
+        return 0
+    return round(rollup.weighted_progress / rollup.weight_total)
+
+
+def coverage_node(id: int, name: Optional[str], rollup: CoverageRollup) -> CoverageNode:
+    return CoverageNode(
+        id=id,
+        name=name or f"#{id}",
+        percentage=percentage(rollup),
+        task_count=rollup.task_count,
+        done_count=rollup.done_count,
+    )
@@ -0,0 +1,38 @@
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from sqlmodel import Session, select
+from backend.database.connection import get_session
+
+from backend.database.models.job_models import Job
+from backend.database.views.job_schemas import JobCreate, JobRead
+from backend.jobs.runner import JOB_HANDLERS, enqueue_job
+
+router = APIRouter(prefix="/jobs")
+
+"""
+    Job: CRUD operations
+    Reads stay on the primary: clients poll status right after enqueueing
+"""
+
+@router.post("/", response_model=JobRead, status_code=202)
+def create_job(job_in: JobCreate, session: Session = Depends(get_session)):
+    if job_in.kind not in JOB_HANDLERS:
+        raise HTTPException(status_code=400, detail=f"Unknown job kind: {job_in.kind}")
+    return enqueue_job(session, job_in.kind, job_in.payload, priority=job_in.priority, max_attempts=job_in.max_attempts)
+
+
+@router.get("/", response_model=List[JobRead])
+def get_jobs(status: Optional[str] = None, limit: int = Query(default=50, ge=1, le=500), session: Session = Depends(get_session)):
+    statement = select(Job).order_by(Job.id.desc()).limit(limit)
+    if status is not None:
+        statement = statement.where(Job.status == status)
+    return session.exec(statement).all()
+
+
+@router.get("/{id}", response_model=JobRead)
+def get_job(id: int, session: Session = Depends(get_session)):
+    job = session.get(Job, id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from backend.database.views.other_schemas import TechStackResponse, SecurityResponse, MetricsResponse, CoverageResponse, AlertLevel, MetricTrend
+from backend.database.views.other_schemas import TechStackResponse, SecurityResponse, MetricsResponse, AlertLevel, MetricTrend
 
 
 router = APIRouter()
@@ -107,20 +107,4 @@ async def get_system_metrics():
                 "trend": MetricTrend.DOWN
             }
         ]
-    }
-
-@router.get("/coverage", response_model=CoverageResponse)
-async def get_coverage():
-    return {
-        "items": [
-            {"category": "Frontend", "percentage": 70},
-            {"category": "Middleware", "percentage": 30},
-            {"category": "Backend", "percentage": 60},
-            {"category": "Database", "percentage": 50},
-            {"category": "Messaging", "percentage": 10},
-            {"category": "DevOps", "percentage": 40},
-            {"category": "Security", "percentage": 20},
-            {"category": "Monitoring", "percentage": 10}
-        ],
-        "overallProgress": 37
     }
\ No newline at end of file
@@ -1,17 +1,25 @@
 import random
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import date
+from typing import Dict, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import JSONResponse
 
 from sqlmodel import Session, select
-from sqlalchemy.orm import selectinload
-from backend.database.connection import get_session
+from backend.database import statements
+from backend.database.connection import get_read_session, get_session
 
 from backend.database.models.task_models import TaskTopicLink, Task, Category, Section, Source, Subcategory, Technology, TaskLevel, TaskPriority, TaskStatus, TaskType, TechnologySubcategory, TechnologyWithSubcatAndCat, Topic
-from backend.database.views.task_schemas import TaskCreate, TaskRead, TaskUpdate
+from backend.database.views.task_schemas import TaskColumnarRead, TaskCreate, TaskRead, TaskUpdate
 from backend.database.views.technology_schemas import TechnologyCreate, TechnologyRead
-from sqlalchemy import text
 
-from backend.routers.topics import get_topic_ids
+from backend.routers.analytics import record_task_event, task_snapshot
+from backend.routers.coverage import coverage_snapshot, record_coverage_change
+from backend.routers.topics import get_topic_ids, record_topic_links_added, record_topic_links_removed
+
+try:
+    import msgpack
+except ImportError:  # msgpack is optional; only ?format=msgpack needs it
+    msgpack = None
 
 router = APIRouter(prefix="/tasks")
 
@@ -28,32 +36,51 @@ async def create_task_with_topics(task_in: TaskCreate, session: Session = Depend
     task = create_task(task_in, session)
 
     # Link the task to the topic(s)
+    topic_ids = list(dict.fromkeys(topic_ids))
     for topic_id in topic_ids:
         session.add(TaskTopicLink(task_id=task.id, topic_id=topic_id))
+    record_topic_links_added(session, topic_ids)
     
     session.commit()
     return task
 
 
-@router.get("/", response_model=List[TaskRead])
-async def get_tasks(session: Session = Depends(get_session)):
-    tasks = session.exec(
-        select(Task).options(selectinload(Task.topics))
-    ).all()
+@router.get(
+    "/",
+    response_model=List[TaskRead],
+    responses={200: {
+        "description": "Task rows. `?format=columnar` returns a TaskColumnarRead object instead, "
+                       "and `?format=msgpack` the same object encoded as MessagePack.",
+        "content": {"application/msgpack": {"schema": TaskColumnarRead.model_json_schema()}},
+    }},
+)
+def get_tasks(
+    format: str = Query(default="json", pattern="^(json|columnar|msgpack)$"),
+    session: Session = Depends(get_read_session),
+):
+    if format == "msgpack" and msgpack is None:
+        raise HTTPException(status_code=400, detail="msgpack format is not available on this server")
+
+    tasks = session.exec(statements.TASKS_WITH_TOPICS).all()
     
     result = []
     for task in tasks:
         result.append(serialize_task(task, session))
     
-    return result
+    if format == "json":
+        return result
+
+    # Compact formats bypass response_model, which only describes the row format
+    payload = serialize_tasks_columnar(result).model_dump()
+    if format == "msgpack":
+        return Response(content=msgpack.packb(payload), media_type="application/msgpack")
+    return JSONResponse(content=payload)
 
 
 @router.put("/{id}", response_model=TaskRead)
-async def update_task(id: int, task_update: TaskUpdate, session: Session = Depends(get_session)):
+def update_task(id: int, task_update: TaskUpdate, session: Session = Depends(get_session)):
     print(f"id: {id}")
-    task = session.exec(
-        select(Task).where(Task.id == id)
-    ).first()
+    task = session.exec(statements.TASK_BY_ID_FOR_UPDATE, params={"id": id}).first()
     
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
@@ -75,7 +102,7 @@ async def update_task(id: int, task_update: TaskUpdate, session: Session = Depen
     for field, value in task_update.model_dump(exclude_unset=True).items():
         print(f"field: {field}, value: {value}")
         if field == "topics":
-            value = session.exec(select(Topic).where(Topic.name.in_(value))).all()
+            value = session.exec(statements.TOPICS_BY_NAMES, params={"names": value}).all()
             updates[field] = value
         #elif field == "section":
         #    resp = session.exec(select(Section).where(Section.name == value)).first()
@@ -92,9 +119,7 @@ async def update_task(id: int, task_update: TaskUpdate, session: Session = Depen
             model_class, id_field = model_mappings[field]
             # Look up the ID for the string value
             print(f"model_class: {model_class}, id_field: {id_field}, value: {value}")
-            result = session.exec(
-                select(model_class).where(model_class.name == value)
-            ).first()
+            result = session.exec(statements.BY_NAME[model_class], params={"name": value}).first()
             if result is None:
                 raise HTTPException(
                     status_code=400,
@@ -105,10 +130,20 @@ async def update_task(id: int, task_update: TaskUpdate, session: Session = Depen
             updates[field] = value
 
     # Apply all updates at once
+    before = task_snapshot(task)
+    coverage_before = coverage_snapshot(task)
+    if "topics" in updates:
+        old_topic_ids = {topic.id for topic in task.topics}
+        new_topic_ids = {topic.id for topic in updates["topics"]}
+        kept_topic_ids = old_topic_ids & new_topic_ids
+        record_topic_links_removed(session, old_topic_ids - kept_topic_ids, kept_topic_ids)
+        record_topic_links_added(session, new_topic_ids - kept_topic_ids, kept_topic_ids)
     for field, value in updates.items():
         setattr(task, field, value)
 
     session.add(task)
+    record_task_event(session, task, "updated", before)
+    record_coverage_change(session, coverage_before, coverage_snapshot(task))
     session.commit()
     session.refresh(task)
     
@@ -117,20 +152,19 @@ async def update_task(id: int, task_update: TaskUpdate, session: Session = Depen
 
 
 @router.delete("/{task_id}", status_code=204)
-async def delete_task(task_id: str, session: Session = Depends(get_session)):
-    task = session.exec(
-        select(Task).where(Task.task_id == task_id)
-    ).first()
+def delete_task(task_id: str, session: Session = Depends(get_session)):
+    task = session.exec(statements.TASK_BY_TASK_ID_FOR_UPDATE, params={"task_id": task_id}).first()
     
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     
     # Delete task topics first
-    session.exec(
-        select(TaskTopicLink).where(TaskTopicLink.task_id == task.id)
-    ).delete()
+    record_topic_links_removed(session, [topic.id for topic in task.topics])
+    task.topics = []
     
     # Delete the task
+    record_task_event(session, task, "deleted", task_snapshot(task))
+    record_coverage_change(session, coverage_snapshot(task), None)
     session.delete(task)
     session.commit()
 
@@ -143,8 +177,8 @@ async def delete_task(task_id: str, session: Session = Depends(get_session)):
 """
 
 @router.get("/priorities", response_model=List[TaskPriority])
-async def get_task_priorities(session: Session = Depends(get_session)):
-    return session.exec(select(TaskPriority)).all()
+def get_task_priorities(session: Session = Depends(get_read_session)):
+    return session.exec(statements.ALL_ROWS[TaskPriority]).all()
 
 
 
@@ -155,8 +189,8 @@ async def get_task_priorities(session: Session = Depends(get_session)):
 """
 
 @router.get("/statuses", response_model=List[TaskStatus])
-async def get_task_statuses(session: Session = Depends(get_session)):
-    return session.exec(select(TaskStatus)).all()
+def get_task_statuses(session: Session = Depends(get_read_session)):
+    return session.exec(statements.ALL_ROWS[TaskStatus]).all()
 
 
 
@@ -167,8 +201,8 @@ async def get_task_statuses(session: Session = Depends(get_session)):
 """
 
 @router.get("/types", response_model=List[TaskType])
-async def get_task_types(session: Session = Depends(get_session)):
-    return session.exec(select(TaskType)).all()
+def get_task_types(session: Session = Depends(get_read_session)):
+    return session.exec(statements.ALL_ROWS[TaskType]).all()
 
 
 
@@ -179,8 +213,8 @@ async def get_task_types(session: Session = Depends(get_session)):
 """
 
 @router.get("/levels", response_model=List[TaskLevel])
-async def get_task_levels(session: Session = Depends(get_session)):
-    return session.exec(select(TaskLevel)).all()
+def get_task_levels(session: Session = Depends(get_read_session)):
+    return session.exec(statements.ALL_ROWS[TaskLevel]).all()
 
 
 
@@ -191,8 +225,8 @@ async def get_task_levels(session: Session = Depends(get_session)):
 """
 
 @router.get("/sources", response_model=List[Source])
-async def get_task_sources(session: Session = Depends(get_session)):
-    return session.exec(select(Source)).all()
+def get_task_sources(session: Session = Depends(get_read_session)):
+    return session.exec(statements.ALL_ROWS[Source]).all()
 
 
 
@@ -203,8 +237,8 @@ async def get_task_sources(session: Session = Depends(get_session)):
 """
 
 @router.get("/categories", response_model=List[Category])
-async def get_task_categories(session: Session = Depends(get_session)):
-    return session.exec(select(Category)).all()
+def get_task_categories(session: Session = Depends(get_read_session)):
+    return session.exec(statements.ALL_ROWS[Category]).all()
 
 
 
@@ -215,8 +249,8 @@ async def get_task_categories(session: Session = Depends(get_session)):
 """
 
 @router.get("/subcategories/{category_id}", response_model=List[Subcategory])
-async def get_task_subcategories_by_category(category_id: int, session: Session = Depends(get_session)):
-    return session.exec(select(Subcategory).where(Subcategory.category_id == category_id)).all()
+async def get_task_subcategories_by_category(category_id: int, session: Session = Depends(get_read_session)):
+    return session.exec(statements.SUBCATEGORIES_BY_CATEGORY, params={"category_id": category_id}).all()
 
 
 
@@ -229,9 +263,7 @@ async def get_task_subcategories_by_category(category_id: int, session: Session
 @router.post("/technologies", response_model=Technology)
 async def create_technology(technology: TechnologyCreate, session: Session = Depends(get_session)):
     print(f"technology: {technology.name}, subcategory_id: {technology.subcategory_id}")
-    existing = session.exec(
-        select(Technology).where(Technology.name == technology.name)
-    ).first()
+    existing = session.exec(statements.BY_NAME[Technology], params={"name": technology.name}).first()
 
     if existing:
         raise HTTPException(
@@ -251,21 +283,8 @@ async def create_technology(technology: TechnologyCreate, session: Session = Dep
 
 
 @router.get("/technologies", response_model=List[TechnologyRead])
-async def get_task_technologies(session: Session = Depends(get_session)):
-    statement = (
-        select(
-            Technology.id.label("id"),
-            Technology.name.label("technology"),
-            Subcategory.name.label("subcategory"),
-            Category.name.label("category"),
-        )
-        .join(TechnologySubcategory, Technology.id == TechnologySubcategory.technology_id)
-        .join(Subcategory, TechnologySubcategory.subcategory_id == Subcategory.id)
-        .join(Category, Subcategory.category_id == Category.id)
-        .order_by(Technology.name, Category.name, Subcategory.name)
-    )
-
-    results = session.exec(statement).all()
+async def get_task_technologies(session: Session = Depends(get_read_session)):
+    results = session.exec(statements.TECHNOLOGIES_WITH_HIERARCHY).all()
 
     # Each result is a tuple of (technology, subcategory, category), so convert to dicts
     return [
@@ -280,19 +299,14 @@ async def get_task_technologies(session: Session = Depends(get_session)):
 
 
 @router.get("/technologies/{subcategory_id}", response_model=List[Technology])
-async def get_task_technologies_by_subcategory(subcategory_id: int, session: Session = Depends(get_session)):
-    statement = (
-        select(Technology)
-        .join(TechnologySubcategory, Technology.id == TechnologySubcategory.technology_id)
-        .where(TechnologySubcategory.subcategory_id == subcategory_id)
-    )
-    results = session.exec(statement).all()
+async def get_task_technologies_by_subcategory(subcategory_id: int, session: Session = Depends(get_read_session)):
+    results = session.exec(statements.TECHNOLOGIES_BY_SUBCATEGORY, params={"subcategory_id": subcategory_id}).all()
     return results
 
 
 # Used for Category pages
 @router.get("/technologies/by-subcategory-name/{subcategory_name}", response_model=List[Technology])
-async def get_task_technologies_by_subcategory_name(subcategory_name: str, session: Session = Depends(get_session)):
+async def get_task_technologies_by_subcategory_name(subcategory_name: str, session: Session = Depends(get_read_session)):
     # First, find the subcategory ID using LIKE for partial matches
     subcategory = session.exec(
         select(Subcategory)
@@ -306,31 +320,13 @@ async def get_task_technologies_by_subcategory_name(subcategory_name: str, sessi
         )
     
     # Then use the subcategory_id to get technologies
-    statement = (
-        select(Technology)
-        .join(TechnologySubcategory, Technology.id == TechnologySubcategory.technology_id)
-        .where(TechnologySubcategory.subcategory_id == subcategory.id)
-    )
-    
-    results = session.exec(statement).all()
+    results = session.exec(statements.TECHNOLOGIES_BY_SUBCATEGORY, params={"subcategory_id": subcategory.id}).all()
     return results
 
 
 @router.get("/technologiesInDetail", response_model=List[TechnologyWithSubcatAndCat])
-async def get_technologies_with_subcategory_and_category(session: Session = Depends(get_session)):
-    query = text("""
-        SELECT t.name AS technology,
-               sc.name AS subcategory,
-               c.name AS category,
-               t.description
-        FROM technology t
-        JOIN technology_subcategory ts ON t.id = ts.technology_id
-        JOIN subcategory sc ON ts.subcategory_id = sc.id
-        JOIN category c ON sc.category_id = c.id
-        ORDER BY t.name, c.name, sc.name;
-    """)
-    rows = session.exec(query).mappings().all()
-    #rows = results.all()
+async def get_technologies_with_subcategory_and_category(session: Session = Depends(get_read_session)):
+    rows = session.exec(statements.TECHNOLOGIES_IN_DETAIL).mappings().all()
     return [TechnologyWithSubcatAndCat(**row) for row in rows]
 
 
@@ -368,11 +364,46 @@ def serialize_task(task: Task, session: Session) -> TaskRead:
         )
 
 
+# Lookup columns whose values repeat across rows and are dictionary-encoded
+DICTIONARY_COLUMNS = ("technology", "subcategory", "category", "source", "level", "type", "status", "priority", "topics")
+
+def serialize_tasks_columnar(rows: List[TaskRead]) -> TaskColumnarRead:
+    columns = {name: [] for name in TaskRead.model_fields}
+    dictionaries = {name: {} for name in DICTIONARY_COLUMNS}
+
+    for row in rows:
+        for name, column in columns.items():
+            value = getattr(row, name)
+            if name == "topics":
+                value = [dictionary_code(dictionaries[name], topic) for topic in value]
+            elif name in dictionaries:
+                value = dictionary_code(dictionaries[name], value)
+            elif isinstance(value, date):
+                value = value.isoformat()
+            column.append(value)
+
+    return TaskColumnarRead(
+        row_count=len(rows),
+        columns=columns,
+        dictionaries={name: list(codes) for name, codes in dictionaries.items()},
+    )
+
+
+def dictionary_code(codes: Dict[str, int], value: Optional[str]) -> Optional[int]:
+    # Codes are assigned in first-seen order, so they index the dictionary list
+    if value is None:
+        return None
+    return codes.setdefault(value, len(codes))
+
+
 def create_task(task_in: TaskCreate, session: Session = Depends(get_session)):
     task_data = task_in.model_dump(exclude={"topics"})  # ⬅️ This prevents the validation error
     task_data["task_id"] = generate_unique_task_id(session)
     task = Task(**task_data)  # ✅ Only valid fields passed
     session.add(task)
+    session.flush()  # assigns task.id for the history event
+    record_task_event(session, task, "created")
+    record_coverage_change(session, None, coverage_snapshot(task))
     session.commit()
     session.refresh(task)
     return task
@@ -382,7 +413,7 @@ def generate_unique_task_id(session, prefix="TASK-", digits=4, max_attempts=10):
     for _ in range(max_attempts):
         random_digits = f"{random.randint(0, 10**digits - 1):0{digits}}"
         task_id = f"{prefix}{random_digits}"
-        exists = session.exec(select(Task).where(Task.task_id == task_id)).first()
+        exists = session.exec(statements.TASK_BY_TASK_ID, params={"task_id": task_id}).first()
         if not exists:
             return task_id
     raise ValueError("Failed to generate unique task_id after multiple attempts")
\ No newline at end of file
@@ -1,18 +1,59 @@
-from typing import List
-from fastapi import APIRouter, Depends
-from sqlmodel import Session, select
-from backend.database.connection import get_session
-from backend.database.models.task_models import Topic
+from collections import Counter
+from itertools import combinations
+from typing import Iterable, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlmodel import Session, func, select
+from sqlalchemy.dialects.postgresql import insert
+from backend.database import statements
+from backend.database.connection import get_read_session, get_session
+from backend.database.models.task_models import Topic, TopicCooccurrence, TopicUsage
+from backend.database.views.topic_schemas import TopicRead
 
 router = APIRouter(prefix="/topics")
 
 """
-    Task Source: CRUD operations
+    Topic: CRUD operations
 """
 
-@router.get("/", response_model=List[Topic])
-async def get_topics(session: Session = Depends(get_session)):
-    return session.exec(select(Topic)).all()
+@router.get("/", response_model=List[TopicRead])
+def get_topics(
+    prefix: Optional[str] = None,
+    limit: Optional[int] = Query(default=None, ge=1, le=1000),
+    session: Session = Depends(get_read_session),
+):
+    task_count = func.coalesce(TopicUsage.task_count, 0)
+    statement = (
+        select(Topic.id, Topic.name, task_count)
+        .outerjoin(TopicUsage, TopicUsage.topic_id == Topic.id)
+        .order_by(task_count.desc(), Topic.name)
+    )
+    if prefix:
+        # Matches the lower(name) text_pattern_ops index on topic
+        escaped = prefix.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        statement = statement.where(func.lower(Topic.name).like(f"{escaped}%", escape="\\"))
+    if limit is not None:
+        statement = statement.limit(limit)
+
+    return [TopicRead(id=topic_id, name=name, task_count=count) for topic_id, name, count in session.exec(statement).all()]
+
+
+@router.get("/{id}/related", response_model=List[TopicRead])
+def get_related_topics(
+    id: int,
+    limit: int = Query(default=10, ge=1, le=100),
+    session: Session = Depends(get_read_session),
+):
+    if session.get(Topic, id) is None:
+        raise HTTPException(status_code=404, detail="Topic not found")
+
+    rows = session.exec(
+        select(Topic.id, Topic.name, TopicCooccurrence.task_count)
+        .join(Topic, Topic.id == TopicCooccurrence.related_topic_id)
+        .where(TopicCooccurrence.topic_id == id, TopicCooccurrence.task_count > 0)
+        .order_by(TopicCooccurrence.task_count.desc(), Topic.name)
+        .limit(limit)
+    ).all()
+    return [TopicRead(id=topic_id, name=name, task_count=count) for topic_id, name, count in rows]
 
 
 """
@@ -28,8 +69,47 @@ def create_topic(topic_name: str, session: Session = Depends(get_session)):
 def get_topic_ids(topic_names: List[str], session: Session = Depends(get_session)):
     topic_ids = []
     for topic_name in topic_names:
-        topic = session.exec(select(Topic).where(Topic.name == topic_name)).first()
+        topic = session.exec(statements.TOPIC_BY_NAME, params={"name": topic_name}).first()
         if not topic:
             topic = create_topic(topic_name, session)
         topic_ids.append(topic.id)
-    return topic_ids
\ No newline at end of file
+    return topic_ids
+
+def record_topic_links_added(session: Session, added: Iterable[int], existing: Iterable[int] = ()):
+    """Bump usage and co-occurrence counts for topics newly linked to a task
+    that already carries `existing`. Does not commit."""
+    update_topic_counts(session, set(added), set(existing), 1)
+
+def record_topic_links_removed(session: Session, removed: Iterable[int], remaining: Iterable[int] = ()):
+    """Reverse of record_topic_links_added for topics unlinked from a task."""
+    update_topic_counts(session, set(removed), set(remaining), -1)
+
+def update_topic_counts(session: Session, changed: set, unchanged: set, step: int):
+    changed -= unchanged
+    if not changed:
+        return
+
+    pairs = Counter()
+    for a in changed:
+        for b in unchanged:
+            pairs[(a, b)] += step
+            pairs[(b, a)] += step
+    for a, b in combinations(changed, 2):
+        pairs[(a, b)] += step
+        pairs[(b, a)] += step
+
+    # Rows go in key order so concurrent writers lock them in the same order
+    usage = insert(TopicUsage).values([{"topic_id": topic_id, "task_count": step} for topic_id in sorted(changed)])
+    session.exec(usage.on_conflict_do_update(
+        index_elements=["topic_id"],
+        set_={"task_count": TopicUsage.task_count + usage.excluded.task_count},
+    ))
+
+    if pairs:
+        cooccurrence = insert(TopicCooccurrence).values([
+            {"topic_id": a, "related_topic_id": b, "task_count": count} for (a, b), count in sorted(pairs.items())
+        ])
+        session.exec(cooccurrence.on_conflict_do_update(
+            index_elements=["topic_id", "related_topic_id"],
+            set_={"task_count": TopicCooccurrence.task_count + cooccurrence.excluded.task_count},
+        ))